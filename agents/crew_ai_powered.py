@@ -8,9 +8,11 @@ import os
 import json
 import logging
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
 import re
 
+from agents.response import AgentResponse
+from app.curriculum import load_curriculum
+
 # AI/LLM imports
 try:
     from langchain.llms import Ollama
@@ -34,15 +36,6 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class AgentResponse:
-    """Response from an AI agent"""
-    agent_name: str
-    response: str
-    confidence: float = 1.0
-    metadata: Dict = None
-    extracted_data: Dict = None
-
 class AIAlphabetTutorAgents:
     """
     Fully AI-powered multi-agent system for KidSafe Alphabet Tutor
@@ -134,8 +127,7 @@ class AIAlphabetTutorAgents:
     def _load_curriculum(self) -> Dict:
         """Load curriculum from JSON file"""
         try:
-            with open('app/curriculum.json', 'r') as f:
-                return json.load(f)
+            return load_curriculum()
         except Exception as e:
             logger.error(f"Failed to load curriculum: {e}")
             return {"letters": {}, "activities": {}}
@@ -332,6 +324,7 @@ class AIAlphabetTutorAgents:
                     self.session_memory.derived_state.child_name = extracted_data["name"]
                 if extracted_data.get("letter"):
                     self.session_memory.derived_state.current_letter = extracted_data["letter"]
+                self.session_memory.mark_state_changed()
                 
                 return AgentResponse(
                     agent_name="Understanding Agent",
@@ -344,7 +337,7 @@ class AIAlphabetTutorAgents:
                 return self._fallback_understanding(user_input)
                 
         except Exception as e:
-            logger.error(f"Understanding agent error: {e}")
+            logger.error("Understanding agent error: %s", e)
             return self._fallback_understanding(user_input)
     
     def _fallback_understanding(self, user_input: str) -> AgentResponse:
@@ -420,7 +413,7 @@ class AIAlphabetTutorAgents:
                 return self._fallback_lesson(letter, letter_info, child_name)
                 
         except Exception as e:
-            logger.error(f"Lesson agent error: {e}")
+            logger.error("Lesson agent error: %s", e)
             return self._fallback_lesson(
                 context.get("current_letter", "A"),
                 {},
@@ -465,6 +458,7 @@ class AIAlphabetTutorAgents:
                     self.session_memory.derived_state.streak_count += 1
                 elif confidence < 0.5:
                     self.session_memory.derived_state.streak_count = 0
+                self.session_memory.mark_state_changed()
                 
                 return AgentResponse(
                     agent_name="Feedback Agent",
@@ -476,7 +470,7 @@ class AIAlphabetTutorAgents:
                 return self._fallback_feedback(letter, confidence, streak)
                 
         except Exception as e:
-            logger.error(f"Feedback agent error: {e}")
+            logger.error("Feedback agent error: %s", e)
             return self._fallback_feedback("A", 0.7, 0)
     
     def _fallback_feedback(self, letter: str, confidence: float, streak: int) -> AgentResponse:
@@ -528,6 +522,7 @@ class AIAlphabetTutorAgents:
                 next_letter = self._extract_next_letter(response)
                 if next_letter:
                     self.session_memory.derived_state.current_letter = next_letter
+                    self.session_memory.mark_state_changed()
                 
                 return AgentResponse(
                     agent_name="Personalization Agent",
@@ -538,7 +533,7 @@ class AIAlphabetTutorAgents:
                 return self._fallback_personalization(child_profile, progress, struggles)
                 
         except Exception as e:
-            logger.error(f"Personalization agent error: {e}")
+            logger.error("Personalization agent error: %s", e)
             return self._fallback_personalization({}, {}, [])
     
     def _extract_next_letter(self, response: str) -> Optional[str]:
@@ -595,7 +590,7 @@ class AIAlphabetTutorAgents:
                 return self._fallback_safety(content)
                 
         except Exception as e:
-            logger.error(f"Safety agent error: {e}")
+            logger.error("Safety agent error: %s", e)
             return self._fallback_safety(content)
     
     def _fallback_safety(self, content: str) -> AgentResponse:
@@ -657,6 +652,7 @@ class AIAlphabetTutorAgents:
                 # Use lesson agent for teaching
                 if extracted_data.get("letter"):
                     self.session_memory.derived_state.current_letter = extracted_data["letter"]
+                    self.session_memory.mark_state_changed()
                 lesson_result = self.lesson_agent_process(context)
                 responses.append(lesson_result.response)
                 
@@ -710,7 +706,7 @@ class AIAlphabetTutorAgents:
             }
             
         except Exception as e:
-            logger.error(f"AI processing error: {e}")
+            logger.error("AI processing error: %s", e)
             # Fallback to simple response
             return {
                 "success": False,
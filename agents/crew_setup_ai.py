@@ -8,13 +8,41 @@ import os
 import json
 import logging
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
 import re
+import random
+
+from app.curriculum import load_curriculum
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fallback feedback templates by confidence band; only the chosen one is formatted
+_FEEDBACK_HIGH = (
+    "Amazing! You've got {letter} perfectly! 🌟",
+    "Wonderful! {letter} sounds great when you say it!",
+    "Excellent work with {letter}! You're a star!"
+)
+_FEEDBACK_MEDIUM = (
+    "Good try with {letter}! You're getting closer!",
+    "Nice work! Let's practice {letter} once more together.",
+    "You're doing well with {letter}! Keep going!"
+)
+_FEEDBACK_LOW = (
+    "Great effort! {letter} can be tricky. Let's try together!",
+    "Good try! Let me help you with {letter}.",
+    "You're working hard on {letter}! Let's practice together."
+)
+
+# Letter game templates
+_GAME_TEMPLATES = (
+    "Let's play 'I Spy'! I spy something that starts with {letter}. Can you guess what it is?",
+    "Can you find 3 things around you that start with {letter}? I'll wait!",
+    "Let's clap the letter {letter}! Clap once for each time you say it: {letter}! {letter}! {letter}!",
+    "Can you make the shape of {letter} with your body? Stand up and try!",
+    "Let's think of animals that start with {letter}. I'll start: {letter} is for {example}!"
+)
+
 # Try to import AI libraries
 try:
     import openai
@@ -36,15 +64,6 @@ try:
 except ImportError:
     OLLAMA_AVAILABLE = False
 
-@dataclass
-class AgentResponse:
-    """Response from an agent"""
-    agent_name: str
-    response: str
-    confidence: float = 1.0
-    metadata: Dict = None
-    extracted_data: Dict = None
-
 class AlphabetTutorAI:
     """
     AI-Powered multi-agent system for KidSafe Alphabet Tutor
@@ -66,8 +85,7 @@ class AlphabetTutorAI:
         
         # Load curriculum
         try:
-            with open('app/curriculum.json', 'r') as f:
-                self.curriculum = json.load(f)
+            self.curriculum = load_curriculum()
         except:
             self.curriculum = {}
         
@@ -174,7 +192,7 @@ class AlphabetTutorAI:
                 
                 return extracted
             except Exception as e:
-                logger.error(f"AI extraction failed: {e}")
+                logger.error("AI extraction failed: %s", e)
         
         # Enhanced rule-based fallback
         return self._rule_based_extraction(user_input)
@@ -284,7 +302,7 @@ class AlphabetTutorAI:
                 
                 return self.llm.predict(prompt)
             except Exception as e:
-                logger.error(f"AI lesson generation failed: {e}")
+                logger.error("AI lesson generation failed: %s", e)
         
         # Fallback to curriculum-based response
         letter_info = self.curriculum.get('letters', {}).get(letter, {})
@@ -319,26 +337,13 @@ class AlphabetTutorAI:
         emotion = context.get('emotion', 'neutral')
         
         if confidence > 0.8:
-            responses = [
-                f"Amazing! You've got {letter} perfectly! 🌟",
-                f"Wonderful! {letter} sounds great when you say it!",
-                f"Excellent work with {letter}! You're a star!"
-            ]
+            responses = _FEEDBACK_HIGH
         elif confidence > 0.5:
-            responses = [
-                f"Good try with {letter}! You're getting closer!",
-                f"Nice work! Let's practice {letter} once more together.",
-                f"You're doing well with {letter}! Keep going!"
-            ]
+            responses = _FEEDBACK_MEDIUM
         else:
-            responses = [
-                f"Great effort! {letter} can be tricky. Let's try together!",
-                f"Good try! Let me help you with {letter}.",
-                f"You're working hard on {letter}! Let's practice together."
-            ]
+            responses = _FEEDBACK_LOW
         
-        import random
-        return random.choice(responses)
+        return random.choice(responses).format(letter=letter)
     
     def process_interaction(self, user_input: str) -> Dict:
         """
@@ -362,6 +367,7 @@ class AlphabetTutorAI:
             
             if extracted.get('letter'):
                 self.session_memory.derived_state.current_letter = extracted['letter']
+            self.session_memory.mark_state_changed()
             
             # Generate appropriate response based on intent
             intent = extracted.get('intent', 'chat')
@@ -379,6 +385,7 @@ class AlphabetTutorAI:
             elif intent == 'next_letter':
                 next_letter = self._get_next_letter(current_letter)
                 self.session_memory.derived_state.current_letter = next_letter
+                self.session_memory.mark_state_changed()
                 response = f"Great job with {current_letter}! Now let's learn {next_letter}. "
                 response += self.generate_lesson(next_letter, context)
             elif intent == 'repeat':
@@ -401,7 +408,7 @@ class AlphabetTutorAI:
             }
             
         except Exception as e:
-            logger.error(f"Error in AI processing: {e}")
+            logger.error("Error in AI processing: %s", e)
             return {
                 'success': False,
                 'response': "Let's learn letters together! What letter interests you?",
@@ -453,12 +460,8 @@ class AlphabetTutorAI:
     
     def _generate_game(self, letter: str) -> str:
         """Generate a letter-based game"""
-        games = [
-            f"Let's play 'I Spy'! I spy something that starts with {letter}. Can you guess what it is?",
-            f"Can you find 3 things around you that start with {letter}? I'll wait!",
-            f"Let's clap the letter {letter}! Clap once for each time you say it: {letter}! {letter}! {letter}!",
-            f"Can you make the shape of {letter} with your body? Stand up and try!",
-            f"Let's think of animals that start with {letter}. I'll start: {letter} is for {self.curriculum.get('letters', {}).get(letter, {}).get('example_words', ['Ant'])[0]}!"
-        ]
-        import random
-        return random.choice(games)
\ No newline at end of file
+        template = random.choice(_GAME_TEMPLATES)
+        example = ""
+        if "{example}" in template:
+            example = self.curriculum.get('letters', {}).get(letter, {}).get('example_words', ['Ant'])[0]
+        return template.format(letter=letter, example=example)
\ No newline at end of file
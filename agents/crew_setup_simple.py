@@ -5,21 +5,19 @@ Author: Nouran Darwish
 """
 
 from typing import Dict, List, Optional, Any
-import json
 import logging
-from dataclasses import dataclass
+import re
+
+from agents.response import AgentResponse
+from app.curriculum import CURRICULUM_PATH, load_curriculum
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class AgentResponse:
-    """Response from an agent"""
-    agent_name: str
-    response: str
-    confidence: float = 1.0
-    metadata: Dict = None
+# Single-letter mentions and name-introduction phrases
+_LETTER_RE = re.compile(r'\b([A-Za-z])\b')
+_NAME_MARKERS = ("my name is", "i am", "i'm", "call me")
 
 class AlphabetTutorAgents:
     """
@@ -27,7 +25,7 @@ class AlphabetTutorAgents:
     Rule-based implementation that mimics CrewAI behavior
     """
     
-    def __init__(self, session_memory, curriculum_path='app/curriculum.json'):
+    def __init__(self, session_memory, curriculum_path=CURRICULUM_PATH):
         """
         Initialize the agent system
         Args:
@@ -36,17 +34,31 @@ class AlphabetTutorAgents:
         """
         self.session_memory = session_memory
         self.curriculum = self._load_curriculum(curriculum_path)
+        
+        # Lesson introductions are fixed per letter, so build them once
+        self._letter_intros = {
+            letter: self._format_letter_intro(letter, info)
+            for letter, info in self.curriculum.get('letters', {}).items()
+        }
         logger.info("Alphabet Tutor Agents initialized (rule-based mode)")
         
     def _load_curriculum(self, path: str) -> Dict:
         """Load curriculum from JSON file"""
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
+            return load_curriculum(path)
         except Exception as e:
             logger.error(f"Failed to load curriculum: {e}")
             return {}
     
+    @staticmethod
+    def _format_letter_intro(letter: str, letter_info: Dict) -> str:
+        """Build the lesson introduction for a letter"""
+        return (
+            f"Let's learn the letter {letter}! "
+            f"It sounds like {letter_info.get('sound_description', letter)}. "
+            f"Like in {letter_info.get('example_words', [''])[0]}!"
+        )
+    
     # Lesson Agent Functions
     def lesson_agent_process(self, context: Dict) -> AgentResponse:
         """
@@ -57,9 +69,9 @@ class AlphabetTutorAgents:
         
         if intent == 'learn_letter':
             letter_info = self.curriculum.get('letters', {}).get(current_letter, {})
-            response = f"Let's learn the letter {current_letter}! "
-            response += f"It sounds like {letter_info.get('sound_description', current_letter)}. "
-            response += f"Like in {letter_info.get('example_words', [''])[0]}!"
+            response = self._letter_intros.get(current_letter)
+            if response is None:
+                response = self._format_letter_intro(current_letter, letter_info)
             
             return AgentResponse(
                 agent_name="Lesson Agent",
@@ -91,6 +103,7 @@ class AlphabetTutorAgents:
         if confidence > 0.8:
             response = f"Excellent! You said '{letter}' perfectly! ⭐"
             self.session_memory.derived_state.streak_count += 1
+            self.session_memory.mark_state_changed()
         elif confidence > 0.6:
             response = f"Good try! The '{letter}' sound is almost there. Let's practice once more!"
         else:
@@ -159,6 +172,7 @@ class AlphabetTutorAgents:
         # Update current letter if detected
         if entities.get('letters'):
             self.session_memory.derived_state.current_letter = entities['letters'][0]
+        self.session_memory.mark_state_changed()
         
         response_map = {
             'introduction': f"Hello! I'm Bubbly, your alphabet friend!",
@@ -195,23 +209,19 @@ class AlphabetTutorAgents:
     
     def _extract_entities(self, user_input: str) -> Dict:
         """Extract entities from user input"""
-        import re
-        
         entities = {
             "letters": [],
             "name": None
         }
         
         # Extract single letters
-        letter_pattern = r'\b([A-Za-z])\b'
-        letters = re.findall(letter_pattern, user_input)
+        letters = _LETTER_RE.findall(user_input)
         entities["letters"] = [l.upper() for l in letters]
         
         # Extract name if introducing
-        markers = ["my name is", "i am", "i'm", "call me"]
         input_lower = user_input.lower()
         
-        for marker in markers:
+        for marker in _NAME_MARKERS:
             if marker in input_lower:
                 idx = input_lower.index(marker) + len(marker)
                 remaining = user_input[idx:].strip()
@@ -322,7 +332,7 @@ class AlphabetTutorAgents:
             }
             
         except Exception as e:
-            logger.error(f"Agent processing error: {e}")
+            logger.error("Agent processing error: %s", e)
             return {
                 'success': False,
                 'response': "Let's learn letters together!",
@@ -0,0 +1,16 @@
+"""
+Shared agent response type
+Author: Nouran Darwish
+"""
+
+from dataclasses import dataclass
+from typing import Dict
+
+@dataclass(slots=True)
+class AgentResponse:
+    """Response from an agent"""
+    agent_name: str
+    response: str
+    confidence: float = 1.0
+    metadata: Dict = None
+    extracted_data: Dict = None
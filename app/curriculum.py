@@ -0,0 +1,36 @@
+"""
+Curriculum Loading for KidSafe Alphabet Tutor
+Parses curriculum.json once per process and shares it between components
+Author: Nouran Darwish
+"""
+
+import os
+import json
+from functools import cache
+from typing import Dict
+
+# orjson parses several times faster than the stdlib; fall back if it isn't installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Resolved next to this module, so loading doesn't depend on the working directory
+CURRICULUM_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'curriculum.json')
+
+
+def load_curriculum(path: str = CURRICULUM_PATH) -> Dict:
+    """
+    Load and parse the curriculum file (memoized per file)
+    The returned dict is shared by every caller and must be treated as read-only;
+    copy it before making changes
+    """
+    return _load_curriculum_file(os.path.abspath(path))
+
+
+@cache
+def _load_curriculum_file(path: str) -> Dict:
+    """Parse one curriculum file (absolute path, so aliases share a cache entry)"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
@@ -10,14 +10,20 @@ import gradio as gr
 import sys
 import os
 import logging
-import json
+import copy
+import re
 import numpy as np
-from typing import Dict, Optional, Tuple, List
-from datetime import datetime
+from typing import Dict, Optional, Tuple, List, TYPE_CHECKING
 import base64
 import io
-from PIL import Image
 import time
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import cache, cached_property, lru_cache
+from importlib.util import find_spec
+from math import gcd
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -27,6 +33,7 @@ load_dotenv()
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.state import SessionMemory
+from app.curriculum import load_curriculum
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -49,15 +56,108 @@ except ImportError:
     SPEECH_AVAILABLE = False
     logger.warning("Speech components not available. Install with: pip install SpeechRecognition pyttsx3")
 
+# Local ASR (faster-whisper + VAD) keeps children's audio on the device.
+# Only check it is installed here; speech.asr pulls in torch, so it is
+# imported when the model is built (see _initialize_asr)
+LOCAL_ASR_AVAILABLE = all(find_spec(module) is not None for module in ("faster_whisper", "torch"))
+if not LOCAL_ASR_AVAILABLE:
+    logger.warning("Local ASR not available, falling back to Google. Install with: pip install faster-whisper torch")
+
+if TYPE_CHECKING:
+    from speech.asr import ASRProcessor
+
 # Import vision components
 try:
     import cv2
     import pytesseract
-    from transformers import pipeline
     VISION_AVAILABLE = True
 except ImportError:
     VISION_AVAILABLE = False
-    logger.warning("Vision components not available. Install with: pip install opencv-python pytesseract transformers")
+    logger.warning("Vision components not available. Install with: pip install opencv-python pytesseract")
+
+# Maximum number of OCR results kept in the perceptual-hash cache
+OCR_CACHE_SIZE = 128
+
+# Tesseract config for single capital letters (skips page layout analysis)
+OCR_CONFIG = '--psm 10 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Frames at least this wide are halved before OCR
+OCR_DOWNSCALE_WIDTH = 640
+
+# Letters in OCR output
+_LETTER_RE = re.compile(r'[A-Za-z]')
+
+# Spoken words: letters, keeping inner hyphens/apostrophes ("x-ray", "don't")
+_WORD_RE = re.compile(r"[a-z]+(?:[-'][a-z]+)*")
+
+# Speech recognizers work at 16 kHz; browser recordings are usually 44.1/48 kHz
+ASR_SAMPLE_RATE = 16000
+
+# A repeat click on the same frame within this many seconds reuses the last reply
+VISION_DEBOUNCE_SECONDS = 0.5
+
+# Phonetic spelling of each letter name
+_PHONETICS: Dict[str, str] = {
+    "A": "ay", "B": "bee", "C": "see", "D": "dee",
+    "E": "ee", "F": "eff", "G": "jee", "H": "aych",
+    # ... continue for all letters
+}
+
+# Common alphabet objects per letter (mock object detection)
+_LETTER_OBJECTS: Dict[str, Tuple[str, ...]] = {
+    "A": ("apple", "ant"),
+    "B": ("ball", "bear"),
+    "C": ("cat", "car"),
+    # ... etc
+}
+
+# Dense A-Z views of the tables above, indexed by _letter_index()
+_PHONETIC_TABLE: Tuple[str, ...] = tuple(
+    _PHONETICS.get(chr(65 + i), chr(97 + i)) for i in range(26)
+)
+_OBJECT_TABLE: Tuple[Tuple[str, ...], ...] = tuple(
+    _LETTER_OBJECTS.get(chr(65 + i), ()) for i in range(26)
+)
+
+@cache
+def _load_phonics_curriculum_cached() -> Dict:
+    """
+    Parse curriculum.json and merge in phonics data once per process
+    The result is shared between tutors and must not be mutated
+    """
+    curriculum = copy.deepcopy(load_curriculum())
+    
+    # Add phonics data if not present
+    phonics_data = {
+        "A": {"sound": "/æ/", "example": "apple", "mouth_shape": "open wide"},
+        "B": {"sound": "/b/", "example": "ball", "mouth_shape": "lips together, pop"},
+        "C": {"sound": "/k/", "example": "cat", "mouth_shape": "back of tongue up"},
+        "D": {"sound": "/d/", "example": "dog", "mouth_shape": "tongue behind teeth"},
+        "E": {"sound": "/ɛ/", "example": "elephant", "mouth_shape": "slightly open"},
+        # ... continue for all letters
+    }
+    
+    # Merge phonics with curriculum
+    for letter, data in phonics_data.items():
+        if letter in curriculum.get("letters", {}):
+            curriculum["letters"][letter].update(data)
+    
+    return curriculum
+
+def _spoken_words(text: str) -> str:
+    """
+    Lower-cased words of text with punctuation dropped, space-joined and
+    space-padded so single words and phrases match with a substring test
+    """
+    return f" {' '.join(_WORD_RE.findall(text.lower()))} "
+
+def _letter_index(letter: str) -> int:
+    """Position of a single letter in the 26-entry tables, or -1"""
+    if len(letter) == 1:
+        idx = ord(letter.upper()) - 65
+        if 0 <= idx < 26:
+            return idx
+    return -1
 
 class FullAIAlphabetTutor:
     """
@@ -78,29 +178,104 @@ class FullAIAlphabetTutor:
         else:
             self.agents = AlphabetTutorAgents(self.session_memory)
         
-        # Initialize speech components
-        if SPEECH_AVAILABLE:
-            self.recognizer = sr.Recognizer()
-            self.tts_engine = self._initialize_tts()
+        # Speech and vision components are created lazily on first use
+        # (see the cached properties below)
+        self._primed = False
+        
+        # TTS runs in the background; the lock keeps utterances from overlapping
+        self._tts_lock = threading.Lock()
+        self._background_tasks = set()
+        
+        # In-flight vision work keyed by frame digest (single-flight)
+        self._vision_inflight: Dict[bytes, asyncio.Task] = {}
         
-        # Initialize vision components
-        if VISION_AVAILABLE:
-            self.vision_model = self._initialize_vision()
+        # Last image-only reply, for debouncing repeated clicks
+        self._last_image_key: Optional[bytes] = None
+        self._last_image_time = 0.0
+        self._last_image_reply: Optional[str] = None
+        
+        # The local Whisper model and its stateful VAD are shared by every
+        # session, so local transcriptions take turns; the Google fallback
+        # is network-bound and runs concurrently
+        self._asr_lock = threading.Lock()
+        
+        # Session memory is shared by every session and the agents write it too,
+        # so agent turns and memory updates (in worker threads) hold this lock
+        self._memory_lock = threading.Lock()
+        # Guards the OCR cache, the assessment aggregates and the summary cache,
+        # which vision threads and the event loop both update (held only briefly)
+        self._stats_lock = threading.Lock()
+        
+        # OCR results keyed by perceptual hash (kids often re-show the same card)
+        self._ocr_cache: "OrderedDict[int, str]" = OrderedDict()
         
         # Load curriculum with phonics
         self.curriculum = self._load_phonics_curriculum()
+        self._letter_phrases = self._build_letter_phrases(self.curriculum)
         
         # Assessment tracking
-        self.assessment_data = {
-            "pronunciation_scores": [],
-            "letters_attempted": [],
-            "objects_recognized": [],
-            "interaction_count": 0,
-            "start_time": datetime.now()
-        }
+        self.assessment_data = self._new_assessment_data()
+        self._summary_cache = ""
+        self._summary_minutes = -1
+        self._summary_dirty = True
         
         logger.info("Full AI System initialized successfully!")
     
+    @cached_property
+    def recognizer(self):
+        """SpeechRecognition recognizer (Google fallback path)"""
+        return sr.Recognizer() if SPEECH_AVAILABLE else None
+    
+    @cached_property
+    def tts_engine(self):
+        """Text-to-speech engine"""
+        return self._initialize_tts() if SPEECH_AVAILABLE else None
+    
+    @cached_property
+    def asr(self):
+        """Local Whisper ASR"""
+        return self._initialize_asr() if SPEECH_AVAILABLE else None
+    
+    @cached_property
+    def vision_model(self):
+        """Vision components"""
+        return self._initialize_vision() if VISION_AVAILABLE else None
+    
+    def prime_components(self):
+        """Build and warm up the speech/vision components in a background thread so the first turn is fast"""
+        if self._primed:
+            return
+        self._primed = True
+        threading.Thread(target=self._warm_up, daemon=True).start()
+    
+    def _warm_up(self):
+        """Create the lazy components and run each once on dummy input"""
+        # Touching the cached properties builds them
+        self.tts_engine
+        self.recognizer
+        
+        if self.asr is not None:
+            self.asr.warmup()
+        
+        if self.vision_model is not None:
+            try:
+                # Loads the Tesseract language data into the OS page cache
+                pytesseract.image_to_string(np.full((32, 32), 255, dtype=np.uint8), config=OCR_CONFIG)
+            except Exception as e:
+                logger.warning("OCR warm-up failed: %s", e)
+    
+    @staticmethod
+    def _new_assessment_data() -> Dict:
+        """Fresh assessment aggregates (running totals, so summaries stay O(1))"""
+        return {
+            "score_sum": 0.0,
+            "score_count": 0,
+            "letter_counts": np.zeros(26, dtype=np.int32),
+            "objects_recognized": set(),
+            "interaction_count": 0,
+            "start_time": time.monotonic()
+        }
+    
     def _initialize_ai_agents(self):
         """Initialize AI-powered agents"""
         openai_key = os.getenv("OPENAI_API_KEY")
@@ -145,10 +320,22 @@ class FullAIAlphabetTutor:
             logger.error(f"TTS initialization failed: {e}")
             return None
     
+    def _initialize_asr(self) -> Optional["ASRProcessor"]:
+        """Initialize local int8 Whisper ASR with VAD gating"""
+        if not LOCAL_ASR_AVAILABLE:
+            return None
+        try:
+            from speech.asr import ASRProcessor
+            return ASRProcessor(model_size="tiny.en", device="cpu")
+        except Exception as e:
+            logger.error("Local ASR initialization failed: %s", e)
+            return None
+    
     def _initialize_vision(self):
         """Initialize vision components"""
         try:
             # For object detection (simplified - in production use YOLO or similar)
+            # A real detector's heavy imports (torch, transformers) belong here, not at module level
             return {
                 "ocr": pytesseract,
                 "object_detector": None  # Would initialize real model here
@@ -158,31 +345,25 @@ class FullAIAlphabetTutor:
             return None
     
     def _load_phonics_curriculum(self):
-        """Load curriculum with phonics emphasis"""
+        """Load curriculum with phonics emphasis (shared, read-only)"""
         try:
-            with open('app/curriculum.json', 'r') as f:
-                curriculum = json.load(f)
-            
-            # Add phonics data if not present
-            phonics_data = {
-                "A": {"sound": "/æ/", "example": "apple", "mouth_shape": "open wide"},
-                "B": {"sound": "/b/", "example": "ball", "mouth_shape": "lips together, pop"},
-                "C": {"sound": "/k/", "example": "cat", "mouth_shape": "back of tongue up"},
-                "D": {"sound": "/d/", "example": "dog", "mouth_shape": "tongue behind teeth"},
-                "E": {"sound": "/ɛ/", "example": "elephant", "mouth_shape": "slightly open"},
-                # ... continue for all letters
-            }
-            
-            # Merge phonics with curriculum
-            for letter, data in phonics_data.items():
-                if letter in curriculum.get("letters", {}):
-                    curriculum["letters"][letter].update(data)
-            
-            return curriculum
+            return _load_phonics_curriculum_cached()
         except Exception as e:
             logger.error(f"Failed to load curriculum: {e}")
             return {"letters": {}, "activities": {}}
     
+    def _build_letter_phrases(self, curriculum: Dict) -> Tuple[Tuple[str, ...], ...]:
+        """Precompute normalized example words/phrases per letter (A-Z) for pronunciation scoring"""
+        letters = curriculum.get("letters", {})
+        return tuple(
+            tuple(
+                phrase
+                for phrase in map(_spoken_words, letters.get(chr(65 + i), {}).get("example_words", []))
+                if phrase.strip()
+            )
+            for i in range(26)
+        )
+    
     def process_speech(self, audio_input):
         """
         Process speech input with ASR
@@ -193,18 +374,13 @@ class FullAIAlphabetTutor:
         
         try:
             # Convert audio to text
-            recognizer = sr.Recognizer()
-            
-            # Process audio file from Gradio
-            if isinstance(audio_input, str):
-                with sr.AudioFile(audio_input) as source:
-                    audio = recognizer.record(source)
+            if self.asr:
+                transcript = self._transcribe_local(audio_input)
             else:
-                # Handle numpy array from Gradio
-                audio = sr.AudioData(audio_input.tobytes(), 16000, 2)
+                transcript = self._transcribe_google(audio_input)
             
-            # Recognize speech
-            transcript = recognizer.recognize_google(audio, language="en-US")
+            if not transcript:
+                return None, 0, "I couldn't understand that. Can you try again?"
             
             # Analyze pronunciation (simplified - in production use proper phonetic analysis)
             pronunciation_score = self._analyze_pronunciation(transcript)
@@ -220,10 +396,73 @@ class FullAIAlphabetTutor:
             
         except sr.UnknownValueError:
             return None, 0, "I couldn't understand that. Can you try again?"
-        except Exception as e:
-            logger.error(f"Speech processing error: {e}")
+        except (sr.RequestError, RuntimeError, ValueError, OSError) as e:
+            logger.error("Speech processing error: %s", e)
             return None, 0, "Speech processing error"
     
+    def _transcribe_local(self, audio_input) -> str:
+        """Transcribe with the on-device Whisper model (silence is skipped by VAD)"""
+        with self._asr_lock:
+            if isinstance(audio_input, str):
+                transcript, _ = self.asr.transcribe_file(audio_input)
+            else:
+                transcript, _ = self.asr.transcribe(audio_input)
+        return transcript
+    
+    def _transcribe_google(self, audio_input) -> str:
+        """Transcribe with the Google Web Speech API (fallback only)"""
+        recognizer = self.recognizer
+        
+        # Process audio file from Gradio
+        if isinstance(audio_input, str):
+            with sr.AudioFile(audio_input) as source:
+                recorded = recognizer.record(source)
+            sample_rate = recorded.sample_rate
+            pcm = np.frombuffer(recorded.get_raw_data(convert_width=2), dtype=np.int16)
+        else:
+            # Handle numpy array (or (rate, array) tuple) from Gradio
+            sample_rate = ASR_SAMPLE_RATE
+            if isinstance(audio_input, tuple):
+                sample_rate, audio_input = audio_input
+            pcm = self._to_pcm16(audio_input)
+            if pcm.ndim > 1:
+                pcm = pcm.mean(axis=1).astype(np.int16)
+        
+        # Upload 16 kHz 16-bit mono rather than the browser's capture rate
+        pcm, sample_rate = self._downsample_pcm16(pcm, sample_rate)
+        audio = sr.AudioData(pcm.tobytes(), sample_rate, 2)
+        
+        return recognizer.recognize_google(audio, language="en-US")
+    
+    @staticmethod
+    def _downsample_pcm16(pcm: np.ndarray, sample_rate: int) -> Tuple[np.ndarray, int]:
+        """Polyphase-resample 16-bit PCM down to ASR_SAMPLE_RATE (lower rates pass through)"""
+        if sample_rate <= ASR_SAMPLE_RATE:
+            return pcm, sample_rate
+        # Imported here so scipy only loads once browser audio needs resampling
+        from scipy.signal import resample_poly
+        
+        g = gcd(ASR_SAMPLE_RATE, sample_rate)
+        resampled = resample_poly(pcm.astype(np.float32), ASR_SAMPLE_RATE // g, sample_rate // g)
+        return np.clip(np.rint(resampled), -32768, 32767).astype(np.int16), ASR_SAMPLE_RATE
+    
+    @staticmethod
+    def _to_pcm16(samples: np.ndarray) -> np.ndarray:
+        """Convert float [-1, 1] or integer samples to 16-bit PCM in one vector op"""
+        if np.issubdtype(samples.dtype, np.floating):
+            return np.clip(samples * 32767, -32768, 32767).astype(np.int16)
+        if samples.dtype == np.int16:
+            return samples
+        # Rescale other integer PCM by its bit depth (int32 keeps its top 16 bits);
+        # unsigned PCM (8-bit WAV) is centred on its mid value
+        bits = 8 * samples.dtype.itemsize
+        wide = samples.astype(np.int64)
+        if np.issubdtype(samples.dtype, np.unsignedinteger):
+            wide -= 1 << (bits - 1)
+        if bits > 16:
+            return (wide >> (bits - 16)).astype(np.int16)
+        return (wide << (16 - bits)).astype(np.int16)
+    
     def _analyze_pronunciation(self, transcript: str) -> float:
         """
         Analyze pronunciation quality
@@ -233,42 +472,37 @@ class FullAIAlphabetTutor:
             return 0.0
         
         current_letter = self.session_memory.derived_state.current_letter
+        spoken = _spoken_words(transcript)
         
-        # Simple scoring based on content
-        score = 0.5  # Base score
-        
-        # Check if they said the letter
-        if current_letter.lower() in transcript.lower():
-            score += 0.3
-        
-        # Check for example words
-        letter_info = self.curriculum.get("letters", {}).get(current_letter, {})
-        example_words = letter_info.get("example_words", [])
-        
-        for word in example_words:
-            if word.lower() in transcript.lower():
-                score += 0.2
-                break
+        # Simple scoring based on content: base score, plus the letter itself,
+        # plus any of its example words ("Apple." and "ice cream" both count)
+        said_letter = f" {current_letter.lower()} " in spoken
+        idx = _letter_index(current_letter)
+        said_word = idx >= 0 and any(phrase in spoken for phrase in self._letter_phrases[idx])
+        score = 0.5 + 0.3 * said_letter + 0.2 * said_word
         
         return min(score, 1.0)
     
     def _generate_pronunciation_feedback(self, transcript: str, score: float, target_letter: str) -> str:
         """Generate AI-powered pronunciation feedback"""
-        if score > 0.8:
-            return f"Excellent! You said '{target_letter}' perfectly! ⭐"
-        elif score > 0.6:
-            return f"Good try! Remember, '{target_letter}' sounds like /{self._get_phonetic(target_letter)}/. Try again!"
+        bucket = 2 if score > 0.8 else 1 if score > 0.6 else 0
+        return self._feedback_template(bucket, target_letter, self._get_phonetic(target_letter))
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _feedback_template(bucket: int, letter: str, phonetic: str) -> str:
+        """Pronunciation feedback for a score bucket (2 = excellent, 1 = close, 0 = practice)"""
+        if bucket == 2:
+            return f"Excellent! You said '{letter}' perfectly! ⭐"
+        elif bucket == 1:
+            return f"Good try! Remember, '{letter}' sounds like /{phonetic}/. Try again!"
         else:
-            return f"Let's practice '{target_letter}' together. It sounds like /{self._get_phonetic(target_letter)}/. Watch my mouth!"
+            return f"Let's practice '{letter}' together. It sounds like /{phonetic}/. Watch my mouth!"
     
     def _get_phonetic(self, letter: str) -> str:
         """Get phonetic representation of letter"""
-        phonetics = {
-            "A": "ay", "B": "bee", "C": "see", "D": "dee",
-            "E": "ee", "F": "eff", "G": "jee", "H": "aych",
-            # ... continue for all letters
-        }
-        return phonetics.get(letter, letter.lower())
+        idx = _letter_index(letter)
+        return _PHONETIC_TABLE[idx] if idx >= 0 else letter.lower()
     
     def process_vision(self, image_input):
         """
@@ -279,52 +513,90 @@ class FullAIAlphabetTutor:
             return None, [], "Vision processing not available"
         
         try:
-            # Convert to PIL Image if needed
-            if isinstance(image_input, np.ndarray):
-                image = Image.fromarray(image_input)
-            else:
-                image = image_input
+            # Grayscale + downscale straight from the webcam array
+            gray = self._prepare_ocr_image(image_input)
             
-            # Detect text/letters using OCR
-            detected_text = pytesseract.image_to_string(image)
-            detected_letters = [c.upper() for c in detected_text if c.isalpha()]
+            # Detect text/letters using OCR (skipped on repeated frames)
+            detected_text = self._cached_ocr(gray)
+            detected_letters = [m.group(0).upper() for m in _LETTER_RE.finditer(detected_text)]
             
-            # Detect objects (simplified - in production use real object detection)
-            detected_objects = self._detect_objects(image)
+            # Detect objects (simplified - in production use real object detection),
+            # unless OCR already read the target letter itself
+            target_letter = self.session_memory.derived_state.current_letter
+            if target_letter in detected_letters:
+                detected_objects = ()
+            else:
+                detected_objects = self._detect_objects(image_input)
             
             # Generate feedback
             feedback = self._generate_vision_feedback(
                 detected_letters,
                 detected_objects,
-                self.session_memory.derived_state.current_letter
+                target_letter
             )
             
             # Update assessment data
-            if detected_letters:
-                self.assessment_data["letters_attempted"].extend(detected_letters)
-            if detected_objects:
-                self.assessment_data["objects_recognized"].extend(detected_objects)
+            with self._stats_lock:
+                if detected_letters:
+                    codes = np.frombuffer("".join(detected_letters).encode("ascii"), dtype=np.uint8) - 65
+                    self.assessment_data["letter_counts"] += np.bincount(codes[codes < 26], minlength=26)
+                if detected_objects:
+                    self.assessment_data["objects_recognized"].update(detected_objects)
+                self._summary_dirty = True
             
             return detected_letters, detected_objects, feedback
             
-        except Exception as e:
-            logger.error(f"Vision processing error: {e}")
+        except (cv2.error, RuntimeError, ValueError, OSError) as e:
+            logger.error("Vision processing error: %s", e)
             return None, [], "Vision processing error"
     
-    def _detect_objects(self, image) -> List[str]:
+    def _dhash(self, gray: np.ndarray) -> int:
+        """Compute a 64-bit difference hash of a grayscale image"""
+        small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+        bits = small[:, 1:] > small[:, :-1]
+        return int.from_bytes(np.packbits(bits).tobytes(), "big")
+    
+    def _prepare_ocr_image(self, image_input) -> np.ndarray:
+        """Convert an RGB(A) frame or PIL image to a small grayscale array"""
+        frame = image_input if isinstance(image_input, np.ndarray) else np.asarray(image_input)
+        
+        if frame.ndim == 3:
+            code = cv2.COLOR_RGBA2GRAY if frame.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+            gray = cv2.cvtColor(frame, code)
+        else:
+            gray = frame
+        
+        if gray.shape[1] >= OCR_DOWNSCALE_WIDTH:
+            gray = cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+        return gray
+    
+    def _cached_ocr(self, gray: np.ndarray) -> str:
+        """Run Tesseract OCR, reusing results for perceptually identical frames"""
+        key = self._dhash(gray)
+        
+        with self._stats_lock:
+            cached = self._ocr_cache.get(key)
+            if cached is not None:
+                self._ocr_cache.move_to_end(key)
+                return cached
+        
+        # Binarize and hand the array to Tesseract directly (outside the lock)
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        text = pytesseract.image_to_string(binary, config=OCR_CONFIG)
+        with self._stats_lock:
+            self._ocr_cache[key] = text
+            if len(self._ocr_cache) > OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+        return text
+    
+    def _detect_objects(self, image) -> Tuple[str, ...]:
         """Detect objects in image (simplified implementation)"""
         # In production, use YOLO, Detectron2, or similar
         # For now, return mock data based on common alphabet objects
-        common_objects = {
-            "A": ["apple", "ant"],
-            "B": ["ball", "bear"],
-            "C": ["cat", "car"],
-            # ... etc
-        }
-        
         current_letter = self.session_memory.derived_state.current_letter
         # Return mock objects for demonstration
-        return common_objects.get(current_letter, [])
+        idx = _letter_index(current_letter)
+        return _OBJECT_TABLE[idx] if idx >= 0 else ()
     
     def _generate_vision_feedback(self, letters: List[str], objects: List[str], target_letter: str) -> str:
         """Generate feedback for vision input"""
@@ -346,68 +618,186 @@ class FullAIAlphabetTutor:
         """Convert text to speech and play it"""
         if SPEECH_AVAILABLE and self.tts_engine:
             try:
-                self.tts_engine.say(text)
-                self.tts_engine.runAndWait()
+                with self._tts_lock:
+                    self.tts_engine.say(text)
+                    self.tts_engine.runAndWait()
             except Exception as e:
-                logger.error(f"TTS error: {e}")
+                logger.error("TTS error: %s", e)
     
-    def process_interaction(self, text_input: str = None, audio_input = None, image_input = None):
+    def _speak_in_background(self, text: str):
+        """Start speaking text without holding up the reply to the UI"""
+        task = asyncio.get_running_loop().create_task(
+            asyncio.to_thread(self.speak_response, text)
+        )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _recognize_speech(self, audio_input):
+        """Run speech recognition for one request in a worker thread"""
+        if audio_input is None:
+            return None
+        
+        try:
+            return await asyncio.to_thread(self.process_speech, audio_input)
+        except Exception as e:
+            logger.error("Speech processing error: %s", e)
+            return None, 0, "Speech processing error"
+    
+    def _run_agents(self, text_input: str) -> Dict:
+        """Run the agents for one turn (worker thread, under the memory lock)"""
+        with self._memory_lock:
+            return self.agents.process_interaction(text_input)
+    
+    def _record_turn(self, user_input: str, response: str):
+        """Add a finished turn to session memory (worker thread, under the memory lock)"""
+        with self._memory_lock:
+            try:
+                self.session_memory.add_turn(user_input, response)
+            except Exception as e:
+                logger.error("Session memory update error: %s", e)
+        with self._stats_lock:
+            self._summary_dirty = True
+    
+    @staticmethod
+    def _frame_key(image_input) -> bytes:
+        """Digest of a frame's pixels (identical snapshots share a key)"""
+        frame = np.ascontiguousarray(image_input)
+        return hashlib.blake2b(frame.data, digest_size=16).digest()
+    
+    async def _single_flight_vision(self, image_input):
+        """
+        Run process_vision in a worker thread, sharing the result with any
+        identical frame already being processed (e.g. a double-clicked button)
+        """
+        if image_input is None:
+            return None
+        
+        key = self._frame_key(image_input)
+        task = self._vision_inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                asyncio.to_thread(self.process_vision, image_input)
+            )
+            self._vision_inflight[key] = task
+            task.add_done_callback(lambda _: self._vision_inflight.pop(key, None))
+        
+        # Shield so one caller going away doesn't cancel the shared work
+        return await asyncio.shield(task)
+    
+    async def process_interaction(self, text_input: str = None, audio_input = None, image_input = None):
+        """Run an interaction to completion and return the full reply"""
+        reply = ""
+        async for reply in self.stream_interaction(text_input, audio_input, image_input):
+            pass
+        return reply
+    
+    async def stream_interaction(self, text_input: str = None, audio_input = None, image_input = None):
         """
         Main interaction processing with all modalities
+        Speech and vision are independent, so they run concurrently.
+        Yields the reply so far: speech/vision feedback as soon as it's ready,
+        then the full reply once the agents have answered
         """
-        responses = []
+        # Debounce repeated clicks on the same image
+        image_key = None
+        if image_input is not None and text_input is None and audio_input is None:
+            image_key = self._frame_key(image_input)
+            if (image_key == self._last_image_key
+                    and time.monotonic() - self._last_image_time < VISION_DEBOUNCE_SECONDS):
+                yield self._last_image_reply
+                return
+        
+        buf = io.StringIO()
         
         # Update interaction count
-        self.assessment_data["interaction_count"] += 1
+        with self._stats_lock:
+            self.assessment_data["interaction_count"] += 1
+            self._summary_dirty = True
+        
+        # Process speech and vision input concurrently
+        speech_result, vision_result = await asyncio.gather(
+            self._recognize_speech(audio_input),
+            self._single_flight_vision(image_input)
+        )
         
         # Process speech input
-        if audio_input is not None:
-            transcript, score, speech_feedback = self.process_speech(audio_input)
+        if speech_result is not None:
+            transcript, score, speech_feedback = speech_result
             if transcript:
                 text_input = transcript
-                responses.append(f"I heard: '{transcript}'")
-                responses.append(speech_feedback)
-                self.assessment_data["pronunciation_scores"].append(score)
+                buf.write("I heard: '")
+                buf.write(transcript)
+                buf.write("' ")
+                buf.write(speech_feedback)
+                buf.write(" ")
+                with self._stats_lock:
+                    self.assessment_data["score_sum"] += score
+                    self.assessment_data["score_count"] += 1
         
         # Process vision input
-        if image_input is not None:
-            letters, objects, vision_feedback = self.process_vision(image_input)
-            responses.append(vision_feedback)
+        if vision_result is not None:
+            letters, objects, vision_feedback = vision_result
+            buf.write(vision_feedback)
+            buf.write(" ")
         
         # Process with AI agents
         if text_input:
-            ai_result = self.agents.process_interaction(text_input)
+            # Show the feedback while the agents work on the answer
+            if buf.tell():
+                yield buf.getvalue().rstrip()
+            
+            ai_result = await asyncio.to_thread(self._run_agents, text_input)
             ai_response = ai_result.get('response', '')
-            responses.append(ai_response)
+            buf.write(ai_response)
             
-            # Speak the response
-            self.speak_response(ai_response)
+            # Speak the response while the reply is sent to the UI
+            self._speak_in_background(ai_response)
         
         # Combine all responses
-        final_response = " ".join(responses) if responses else "Let's learn the alphabet together!"
+        final_response = buf.getvalue().rstrip() or "Let's learn the alphabet together!"
         
-        # Update session memory
-        self.session_memory.add_turn(
-            text_input or "multimodal_input",
-            final_response
-        )
+        # Update session memory (the lock may be held by another turn's agents,
+        # so wait for it in a worker thread rather than on the event loop)
+        await asyncio.to_thread(self._record_turn, text_input or "multimodal_input", final_response)
         
-        return final_response
+        if image_key is not None:
+            self._last_image_key = image_key
+            self._last_image_time = time.monotonic()
+            self._last_image_reply = final_response
+        
+        yield final_response
+    
+    def reset_assessment(self):
+        """Reset assessment data to its initial state"""
+        with self._stats_lock:
+            self.assessment_data = self._new_assessment_data()
+            self._summary_dirty = True
+    
+    def reset_session(self):
+        """Clear session memory and assessment data (worker thread; waits for any agent turn)"""
+        with self._memory_lock:
+            self.session_memory.reset()
+        self.reset_assessment()
     
     def get_assessment_summary(self) -> str:
-        """Generate assessment summary for UI display"""
-        data = self.assessment_data
-        duration = (datetime.now() - data["start_time"]).seconds // 60
-        
-        avg_pronunciation = np.mean(data["pronunciation_scores"]) if data["pronunciation_scores"] else 0
-        
-        summary = f"""
+        """Generate assessment summary for UI display (cached until data changes)"""
+        with self._stats_lock:
+            data = self.assessment_data
+            duration = int(time.monotonic() - data["start_time"]) // 60
+            
+            if not self._summary_dirty and duration == self._summary_minutes:
+                return self._summary_cache
+            
+            avg_pronunciation = data["score_sum"] / data["score_count"] if data["score_count"] else 0
+            letters_attempted = [chr(65 + i) for i in np.flatnonzero(data["letter_counts"])[:10]]
+            
+            summary = f"""
         📊 **Assessment Summary**
             
         **Session Duration**: {duration} minutes
         **Interactions**: {data['interaction_count']}
-        **Letters Attempted**: {', '.join(list(set(data['letters_attempted']))[:10])}
-        **Objects Recognized**: {', '.join(list(set(data['objects_recognized']))[:5])}
+        **Letters Attempted**: {', '.join(letters_attempted)}
+        **Objects Recognized**: {', '.join(list(data['objects_recognized'])[:5])}
         **Pronunciation Score**: {avg_pronunciation:.1%}
             
         **Current Progress**:
@@ -415,22 +805,47 @@ class FullAIAlphabetTutor:
         - Difficulty: {self.session_memory.derived_state.difficulty_level.value}
         - Streak: {self.session_memory.derived_state.streak_count}
         """
-        
-        return summary
+            
+            self._summary_cache = summary
+            self._summary_minutes = duration
+            self._summary_dirty = False
+            return summary
+
+def use_uvloop():
+    """Run the server's event loop on uvloop when it's installed (not available on Windows)"""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
-# Initialize the full AI tutor
-print("=" * 70)
-print("Initializing FULL AI-Powered KidSafe Alphabet Tutor")
-print("Features: Speech Recognition, Text-to-Speech, Vision, AI Intelligence")
-print("=" * 70)
+# The full AI tutor is created on first use, so importing this module
+# (or starting extra workers) doesn't load models up front
+_tutor: Optional[FullAIAlphabetTutor] = None
+_tutor_lock = threading.Lock()
 
-tutor = FullAIAlphabetTutor()
+def get_tutor() -> FullAIAlphabetTutor:
+    """Return the shared tutor, creating it on first call"""
+    global _tutor
+    if _tutor is None:
+        with _tutor_lock:
+            if _tutor is None:
+                print("=" * 70)
+                print("Initializing FULL AI-Powered KidSafe Alphabet Tutor")
+                print("Features: Speech Recognition, Text-to-Speech, Vision, AI Intelligence")
+                print("=" * 70)
+                _tutor = FullAIAlphabetTutor()
+    return _tutor
+
+# Built once and shared if the interface is recreated (reloads, tests)
+_THEME = gr.themes.Soft()
 
 # Create the Gradio interface
 def create_full_interface():
     """Create the complete assessment UI"""
     
-    with gr.Blocks(title="KidSafe Alphabet Tutor - Full AI Mode", theme=gr.themes.Soft()) as app:
+    with gr.Blocks(title="KidSafe Alphabet Tutor - Full AI Mode", theme=_THEME) as app:
         gr.Markdown("""
         # 🎓 KidSafe Alphabet Tutor - FULL AI-Powered Mode
         ### Complete Speech + Vision + AI System 🗣️👁️🤖
@@ -445,23 +860,23 @@ def create_full_interface():
                     bubble_full_width=False,
                     label="Conversation with Bubbly"
                 )
-                print("Chatbot initialized")
+                # Server-side copy of the chat, so the history isn't uploaded on every click
+                history_state = gr.State([])
                 # Input methods
                 with gr.Tab("🎤 Speech"):
                     audio_input = gr.Audio(
                         sources="microphone",
                         type="filepath",
+                        format="wav",  # Plain PCM on disk, decoded straight into Whisper
                         label="Click to speak!"
                     )
                     speech_button = gr.Button("🗣️ Process Speech", variant="primary")
-                print("Speech input initialized")
                 with gr.Tab("⌨️ Text"):
                     text_input = gr.Textbox(
                         placeholder="Type your message here...",
                         label="Text Input"
                     )
                     text_button = gr.Button("📤 Send Text", variant="primary")
-                print("Text input initialized")
                 with gr.Tab("📷 Vision"):
                     image_input = gr.Image(
                         sources="webcam",
@@ -469,10 +884,8 @@ def create_full_interface():
                         label="Show me a letter or object!"
                     )
                     vision_button = gr.Button("👁️ Process Image", variant="primary")
-                print("Vision input initialized")
                 # Clear button
                 clear_button = gr.Button("🔄 Clear Conversation")
-            print("Clear button initialized")
             # Assessment and status column
             with gr.Column(scale=1):
                 # System status
@@ -483,7 +896,6 @@ def create_full_interface():
                 **Vision**: {'✅ Ready' if VISION_AVAILABLE else '❌ Unavailable'}
                 **TTS**: {'✅ Active' if SPEECH_AVAILABLE else '❌ Unavailable'}
                 """)
-                print("Status display initialized")
                 # Current lesson
                 gr.Markdown("### 📚 Current Lesson")
                 lesson_display = gr.Markdown("""
@@ -491,14 +903,11 @@ def create_full_interface():
                 **Sound**: /ay/
                 **Example**: Apple
                 """)
-                print("Lesson display initialized")
                 # Assessment summary
                 gr.Markdown("### 📊 Assessment")
                 assessment_display = gr.Markdown("")
-                print("Assessment display initialized")
                 # Refresh button
                 refresh_button = gr.Button("🔄 Update Assessment", size="sm")
-                print("Refresh button initialized")
         # Phonics guide
         with gr.Row():
             gr.Markdown("""
@@ -515,84 +924,116 @@ def create_full_interface():
             2. **Vision**: Show me the letter or an object that starts with it
             3. **Practice**: Repeat after Bubbly for perfect pronunciation
             """)
-        print("Phonics guide initialized")
+        logger.debug("Interface widgets initialized")
+        
         # Event handlers
-        def handle_speech(audio, history):
+        # Each handler shows the child's turn right away, then streams in
+        # Bubbly's reply as it is produced. Every widget other than the chat
+        # is sent once per turn; gr.update() leaves it untouched.
+        # The updated history is returned to history_state rather than relying
+        # on Gradio passing the same list object in
+        async def handle_speech(audio, history):
+            tutor = get_tutor()
             if audio:
-                response = tutor.process_interaction(audio_input=audio)
-                history = history or []
-                history.append(["🎤 [Speech Input]", response])
-                return history, None, tutor.get_assessment_summary()
-            return history, None, tutor.get_assessment_summary()
+                history.append(["🎤 [Speech Input]", None])
+                yield history, None, gr.update(), history
+                async for partial in tutor.stream_interaction(audio_input=audio):
+                    history[-1][1] = partial
+                    yield history, gr.update(), gr.update(), gr.update()
+                yield gr.update(), gr.update(), tutor.get_assessment_summary(), history
+            else:
+                yield history, None, gr.update(), gr.update()
         
-        def handle_text(text, history):
+        async def handle_text(text, history):
+            tutor = get_tutor()
             if text:
-                response = tutor.process_interaction(text_input=text)
-                history = history or []
-                history.append([text, response])
-                return history, "", tutor.get_assessment_summary()
-            return history, "", tutor.get_assessment_summary()
+                history.append([text, None])
+                yield history, "", gr.update(), history
+                async for partial in tutor.stream_interaction(text_input=text):
+                    history[-1][1] = partial
+                    yield history, gr.update(), gr.update(), gr.update()
+                yield gr.update(), gr.update(), tutor.get_assessment_summary(), history
+            else:
+                yield history, "", gr.update(), gr.update()
         
-        def handle_vision(image, history):
+        async def handle_vision(image, history):
+            tutor = get_tutor()
             if image is not None:
-                response = tutor.process_interaction(image_input=image)
-                history = history or []
-                history.append(["📷 [Image Input]", response])
-                return history, None, tutor.get_assessment_summary()
-            return history, None, tutor.get_assessment_summary()
-        
-        def clear_conversation():
-            tutor.session_memory.reset()
-            # Reset assessment data to initial state
-            tutor.assessment_data = {
-                "pronunciation_scores": [],
-                "letters_attempted": [],
-                "objects_recognized": [],
-                "interaction_count": 0,
-                "start_time": datetime.now()
-            }
-            return None, tutor.get_assessment_summary()
+                history.append(["📷 [Image Input]", None])
+                yield history, None, gr.update(), history
+                async for partial in tutor.stream_interaction(image_input=image):
+                    history[-1][1] = partial
+                    yield history, gr.update(), gr.update(), gr.update()
+                yield gr.update(), gr.update(), tutor.get_assessment_summary(), history
+            else:
+                yield history, None, gr.update(), gr.update()
+        
+        async def clear_conversation():
+            tutor = get_tutor()
+            # Reset session memory and assessment data to their initial state
+            await asyncio.to_thread(tutor.reset_session)
+            return None, tutor.get_assessment_summary(), []
+        
+        def refresh_summary():
+            return get_tutor().get_assessment_summary()
         
         # Connect events
         speech_button.click(
             handle_speech,
-            [audio_input, chatbot],
-            [chatbot, audio_input, assessment_display]
+            [audio_input, history_state],
+            [chatbot, audio_input, assessment_display, history_state]
         )
         
         text_button.click(
             handle_text,
-            [text_input, chatbot],
-            [chatbot, text_input, assessment_display]
+            [text_input, history_state],
+            [chatbot, text_input, assessment_display, history_state]
         )
         
         vision_button.click(
             handle_vision,
-            [image_input, chatbot],
-            [chatbot, image_input, assessment_display]
+            [image_input, history_state],
+            [chatbot, image_input, assessment_display, history_state]
         )
         
         clear_button.click(
             clear_conversation,
             None,
-            [chatbot, assessment_display]
+            [chatbot, assessment_display, history_state]
         )
         
         refresh_button.click(
-            lambda: str(tutor.get_assessment_summary() or ""),
+            refresh_summary,
             None,
             assessment_display
         )
         
-        # Initial greeting
-        app.load(
-            lambda: ([["", "Hi! I'm Bubbly! 🫧 Let's learn the alphabet with speech and vision! Say hello or show me a letter!"]], tutor.get_assessment_summary()),
-            None,
-            [chatbot, assessment_display]
-        )
+        # Initial greeting (the first page load also builds the tutor,
+        # after the server is already listening)
+        def greet():
+            tutor = get_tutor()
+            # Warm the speech components in the background within the same event
+            tutor.prime_components()
+            history = [["", "Hi! I'm Bubbly! 🫧 Let's learn the alphabet with speech and vision! Say hello or show me a letter!"]]
+            return history, tutor.get_assessment_summary(), history
+        
+        app.load(greet, None, [chatbot, assessment_display, history_state])
     
     return app
 
+def launch_app():
+    """Build the interface and start the server (the single launch path for every entry point)"""
+    use_uvloop()
+    app = create_full_interface()
+    app.queue(max_size=20, default_concurrency_limit=8).launch(
+        server_name="0.0.0.0",
+        server_port=7860,
+        share=True,
+        debug=False,
+        show_api=False,
+        show_error=True
+    )
+
 # Create and launch the interface
 if __name__ == "__main__":
     print("\n" + "="*70)
@@ -605,11 +1046,4 @@ if __name__ == "__main__":
     print("\nOpen your browser to: http://localhost:7860")
     print("="*70 + "\n")
     
-    app = create_full_interface()
-    app.queue(max_size=20).launch(
-        server_name="0.0.0.0",
-        server_port=7860,
-        share=True,
-        debug=False,
-        show_api=False
-    )
\ No newline at end of file
+    launch_app()
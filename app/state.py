@@ -5,11 +5,24 @@ Author: Nouran Darwish
 """
 
 from collections import deque
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
 import json
+import re
+import time
 from dataclasses import dataclass, asdict
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
+
+# Single letter mentions, matched against upper-cased text
+_LETTER_RE = re.compile(r'\b([A-Z])\b')
+
+# Name-introduction phrases in priority order
+_NAME_MARKERS = ("my name is", "i am", "i'm", "call me")
+_NAME_MARKER_RE = re.compile("|".join(map(re.escape, _NAME_MARKERS)))
+# Punctuation dropped from an extracted name
+_NAME_PUNCT = str.maketrans('', '', '.,!?;:')
 
 class DifficultyLevel(Enum):
     EASY = "easy"
@@ -38,14 +51,54 @@ class DerivedState:
     last_mistake: Optional[str] = None
     streak_count: int = 0
     age_range: AgeRange = AgeRange.YOUNGER
-    letters_completed: List[str] = None
-    letters_struggled: List[str] = None
+    # Insertion-ordered sets (dict keys): keep the order letters were
+    # added, with O(1) membership
+    letters_completed: Dict[str, None] = None
+    letters_struggled: Dict[str, None] = None
     
     def __post_init__(self):
         if self.letters_completed is None:
-            self.letters_completed = []
+            self.letters_completed = {}
         if self.letters_struggled is None:
-            self.letters_struggled = []
+            self.letters_struggled = {}
+
+# Letter pools by difficulty, and where to go once a pool is completed
+_EASY_LETTERS = ('A', 'E', 'I', 'O', 'U')  # Vowels
+_MEDIUM_LETTERS = ('B', 'C', 'D', 'F', 'G', 'H', 'L', 'M', 'N', 'P', 'R', 'S', 'T')
+_HARD_LETTERS = ('J', 'K', 'Q', 'V', 'W', 'X', 'Y', 'Z')
+_LETTER_POOLS = {
+    DifficultyLevel.EASY: _EASY_LETTERS,
+    DifficultyLevel.MEDIUM: _MEDIUM_LETTERS,
+    DifficultyLevel.HARD: _HARD_LETTERS,
+}
+_COMPLETED_FALLBACK = {
+    DifficultyLevel.EASY: _MEDIUM_LETTERS[0],
+    DifficultyLevel.MEDIUM: _HARD_LETTERS[0],
+    DifficultyLevel.HARD: "A",  # Start over
+}
+
+@lru_cache(maxsize=64)
+def _suggest_letter(difficulty_level: DifficultyLevel, letters_completed: FrozenSet[str],
+                    letters_struggled: Tuple[str, ...]) -> str:
+    """
+    Pick the next letter for a progress snapshot
+    Memoized: repeated "next letter" turns with unchanged progress are a dict lookup
+    """
+    # Filter out completed letters for this difficulty
+    available = [l for l in _LETTER_POOLS[difficulty_level]
+                if l not in letters_completed]
+    
+    # Prioritize letters that need practice
+    if letters_struggled:
+        for letter in letters_struggled:
+            if letter in available:
+                return letter
+                
+    # Return next available letter, or move to the next level once
+    # every letter at this difficulty is completed
+    if available:
+        return available[0]
+    return _COMPLETED_FALLBACK[difficulty_level]
 
 class SessionMemory:
     """
@@ -59,31 +112,31 @@ class SessionMemory:
         Args:
             max_turns: Maximum conversation turns to keep (default: 3)
         """
-        self.conversation_buffer = deque(maxlen=max_turns * 2)  # User + Assistant pairs
+        # Child and assistant messages in parallel buffers, one entry per turn
+        self._user_turns = deque(maxlen=max_turns)
+        self._assistant_turns = deque(maxlen=max_turns)
         self.derived_state = DerivedState()
         self.session_start = datetime.now()
+        self._session_start_mono = time.monotonic()  # For elapsed time
         self.total_interactions = 0
         self.current_activity = None
         self.vision_enabled = False
         self.tts_enabled = True
         self.asr_enabled = True
+        self._conversation_text = None  # Formatted history, rebuilt only when turns change
+        # Formatted memory text, rebuilt after mark_state_changed()
+        self._memory_text_cache = None
         
     def add_turn(self, user_input: str, assistant_response: str, 
                  intent: Optional[str] = None, confidence: Optional[float] = None):
         """
         Add a conversation turn to the buffer
         """
-        turn = ConversationTurn(
-            timestamp=datetime.now().isoformat(),
-            user_input=user_input,
-            assistant_response=assistant_response,
-            detected_intent=intent,
-            confidence_score=confidence
-        )
-        
         # Add to buffer (maintains max size automatically)
-        self.conversation_buffer.append(("user", user_input))
-        self.conversation_buffer.append(("assistant", assistant_response))
+        self._user_turns.append(user_input)
+        self._assistant_turns.append(assistant_response)
+        self._conversation_text = None
+        self.mark_state_changed()
         
         self.total_interactions += 1
         
@@ -95,181 +148,176 @@ class SessionMemory:
         """
         Analyze conversation and update derived state
         """
+        state = self.derived_state
+        
         # Extract child's name if mentioned
-        if not self.derived_state.child_name:
+        if not state.child_name:
             name = self._extract_name(user_input)
             if name:
-                self.derived_state.child_name = name
+                state.child_name = name
         
         # Update current letter based on conversation
         letter = self._extract_current_letter(user_input, assistant_response)
         if letter:
-            self.derived_state.current_letter = letter
+            state.current_letter = letter
+        current = state.current_letter
             
         # Track mistakes and successes
         if confidence:
             if confidence < 0.6:
-                self.derived_state.last_mistake = self.derived_state.current_letter
-                self.derived_state.streak_count = 0
-                if self.derived_state.current_letter not in self.derived_state.letters_struggled:
-                    self.derived_state.letters_struggled.append(self.derived_state.current_letter)
+                state.last_mistake = current
+                state.streak_count = 0
+                state.letters_struggled.setdefault(current)
             elif confidence > 0.8:
-                self.derived_state.streak_count += 1
-                if self.derived_state.current_letter not in self.derived_state.letters_completed:
-                    self.derived_state.letters_completed.append(self.derived_state.current_letter)
+                state.streak_count += 1
+                state.letters_completed.setdefault(current)
                     
         # Adjust difficulty based on performance
         self._adjust_difficulty()
         
     def _extract_name(self, user_input: str) -> Optional[str]:
         """Extract child's name from input"""
-        markers = ["my name is", "i am", "i'm", "call me"]
         input_lower = user_input.lower()
         
-        for marker in markers:
-            if marker in input_lower:
-                idx = input_lower.index(marker) + len(marker)
-                remaining = user_input[idx:].strip()
-                # Extract first word as name
-                name = remaining.split()[0] if remaining else None
-                if name:
+        # One scan for where each marker first appears
+        marker_ends = {}
+        for match in _NAME_MARKER_RE.finditer(input_lower):
+            marker_ends.setdefault(match.group(), match.end())
+        
+        for marker in _NAME_MARKERS:
+            if marker in marker_ends:
+                # Extract first word after the marker as name
+                words = user_input[marker_ends[marker]:].split(None, 1)
+                if words:
                     # Clean up name
-                    name = name.strip(".,!?")
+                    name = words[0].translate(_NAME_PUNCT)
                     return name.capitalize()
         return None
         
     def _extract_current_letter(self, user_input: str, assistant_response: str) -> Optional[str]:
         """Extract current letter being practiced"""
-        # Check for explicit letter mentions
-        import re
-        
-        # Pattern for single letter mentions
-        letter_pattern = r'\b([A-Z])\b'
-        
-        # Check user input
-        user_matches = re.findall(letter_pattern, user_input.upper())
-        if user_matches and len(user_matches[0]) == 1:
-            return user_matches[0]
+        # Check user input, then the assistant response; only the first
+        # explicit letter mention matters
+        match = _LETTER_RE.search(user_input.upper())
+        if match:
+            return match.group(1)
             
-        # Check assistant response
-        asst_matches = re.findall(letter_pattern, assistant_response.upper())
-        if asst_matches and len(asst_matches[0]) == 1:
-            return asst_matches[0]
+        match = _LETTER_RE.search(assistant_response.upper())
+        if match:
+            return match.group(1)
             
         return None
         
     def _adjust_difficulty(self):
         """Adjust difficulty based on performance"""
-        if self.derived_state.streak_count >= 5:
-            if self.derived_state.difficulty_level == DifficultyLevel.EASY:
-                self.derived_state.difficulty_level = DifficultyLevel.MEDIUM
-            elif self.derived_state.difficulty_level == DifficultyLevel.MEDIUM:
-                self.derived_state.difficulty_level = DifficultyLevel.HARD
+        state = self.derived_state
+        level = state.difficulty_level
+        
+        if state.streak_count >= 5:
+            if level == DifficultyLevel.EASY:
+                state.difficulty_level = DifficultyLevel.MEDIUM
+            elif level == DifficultyLevel.MEDIUM:
+                state.difficulty_level = DifficultyLevel.HARD
                 
-        elif len(self.derived_state.letters_struggled) >= 3:
-            if self.derived_state.difficulty_level == DifficultyLevel.HARD:
-                self.derived_state.difficulty_level = DifficultyLevel.MEDIUM
-            elif self.derived_state.difficulty_level == DifficultyLevel.MEDIUM:
-                self.derived_state.difficulty_level = DifficultyLevel.EASY
+        elif len(state.letters_struggled) >= 3:
+            if level == DifficultyLevel.HARD:
+                state.difficulty_level = DifficultyLevel.MEDIUM
+            elif level == DifficultyLevel.MEDIUM:
+                state.difficulty_level = DifficultyLevel.EASY
                 
     def get_conversation_history(self) -> List[Tuple[str, str]]:
-        """Get the conversation history as list of tuples"""
-        return list(self.conversation_buffer)
+        """Get the conversation history as list of (role, text) tuples"""
+        history = []
+        for user_msg, asst_msg in zip(self._user_turns, self._assistant_turns):
+            history.append(("user", user_msg))
+            history.append(("assistant", asst_msg))
+        return history
+        
+    def mark_state_changed(self):
+        """
+        Drop cached views of the state
+        Call after changing derived_state directly (add_turn, reset and
+        update_settings do this themselves)
+        """
+        self._memory_text_cache = None
         
     def get_derived_state_dict(self) -> Dict:
-        """Get derived state as dictionary"""
+        """Get derived state as dictionary (built fresh, safe for callers to modify)"""
+        state = self.derived_state
+        minutes, seconds = divmod(int(time.monotonic() - self._session_start_mono), 60)
+        hours, minutes = divmod(minutes, 60)
         state_dict = {
-            "child_name": self.derived_state.child_name,
-            "current_letter": self.derived_state.current_letter,
-            "difficulty_level": self.derived_state.difficulty_level.value,
-            "last_mistake": self.derived_state.last_mistake,
-            "streak_count": self.derived_state.streak_count,
-            "age_range": self.derived_state.age_range.value,
-            "letters_completed": self.derived_state.letters_completed,
-            "letters_struggled": self.derived_state.letters_struggled,
+            "child_name": state.child_name,
+            "current_letter": state.current_letter,
+            "difficulty_level": state.difficulty_level.value,
+            "last_mistake": state.last_mistake,
+            "streak_count": state.streak_count,
+            "age_range": state.age_range.value,
+            "letters_completed": list(state.letters_completed),
+            "letters_struggled": list(state.letters_struggled),
             "total_interactions": self.total_interactions,
-            "session_duration": str(datetime.now() - self.session_start)
+            "session_duration": f"{hours}:{minutes:02d}:{seconds:02d}"
         }
         return state_dict
         
+    def _format_conversation(self) -> str:
+        """Format the conversation buffer, reusing the cached text until a turn is added"""
+        if self._conversation_text is None:
+            # Format conversation pairs
+            formatted_pairs = [
+                f"Child: {user_msg}\nBubbly: {asst_msg}"
+                for user_msg, asst_msg in zip(self._user_turns, self._assistant_turns)
+            ]
+                    
+            self._conversation_text = "\n---\n".join(formatted_pairs[-3:])  # Last 3 exchanges
+        return self._conversation_text
+        
     def get_formatted_memory(self) -> str:
-        """Get formatted memory for display"""
-        history = self.get_conversation_history()
-        state = self.get_derived_state_dict()
+        """Get formatted memory for display (cached until the state changes)"""
+        if self._memory_text_cache is not None:
+            return self._memory_text_cache
+        
+        # Read the fields shown here directly; the full state dict also
+        # computes the session duration, which isn't displayed
+        state = self.derived_state
         
-        # Format conversation pairs
-        formatted_pairs = []
-        for i in range(0, len(history), 2):
-            if i + 1 < len(history):
-                user_msg = history[i][1]
-                asst_msg = history[i + 1][1]
-                formatted_pairs.append(f"Child: {user_msg}\nBubbly: {asst_msg}")
-                
         memory_text = "=== Recent Conversation ===\n"
-        memory_text += "\n---\n".join(formatted_pairs[-3:])  # Last 3 exchanges
+        memory_text += self._format_conversation()
         
         memory_text += "\n\n=== Derived State ===\n"
-        memory_text += f"Name: {state['child_name'] or 'Unknown'}\n"
-        memory_text += f"Current Letter: {state['current_letter']}\n"
-        memory_text += f"Difficulty: {state['difficulty_level']}\n"
-        memory_text += f"Streak: {state['streak_count']} correct\n"
-        memory_text += f"Age Range: {state['age_range']}\n"
+        memory_text += f"Name: {state.child_name or 'Unknown'}\n"
+        memory_text += f"Current Letter: {state.current_letter}\n"
+        memory_text += f"Difficulty: {state.difficulty_level.value}\n"
+        memory_text += f"Streak: {state.streak_count} correct\n"
+        memory_text += f"Age Range: {state.age_range.value}\n"
         
-        if state['letters_completed']:
-            memory_text += f"Mastered: {', '.join(state['letters_completed'][:5])}\n"
-        if state['letters_struggled']:
-            memory_text += f"Needs Practice: {', '.join(state['letters_struggled'][:3])}\n"
+        if state.letters_completed:
+            memory_text += f"Mastered: {', '.join(islice(state.letters_completed, 5))}\n"
+        if state.letters_struggled:
+            memory_text += f"Needs Practice: {', '.join(islice(state.letters_struggled, 3))}\n"
             
+        self._memory_text_cache = memory_text
         return memory_text
         
     def suggest_next_letter(self) -> str:
         """Suggest next letter based on current progress"""
         # Simple progression through alphabet
-        try:
-            # Define letter pools by difficulty
-            easy_letters = ['A', 'E', 'I', 'O', 'U']  # Vowels
-            medium_letters = ['B', 'C', 'D', 'F', 'G', 'H', 'L', 'M', 'N', 'P', 'R', 'S', 'T']
-            hard_letters = ['J', 'K', 'Q', 'V', 'W', 'X', 'Y', 'Z']
-            
-            # Get appropriate difficulty letters
-            if self.derived_state.difficulty_level == DifficultyLevel.EASY:
-                letter_pool = easy_letters
-            elif self.derived_state.difficulty_level == DifficultyLevel.MEDIUM:
-                letter_pool = medium_letters
-            else:
-                letter_pool = hard_letters
-                
-            # Filter out completed letters
-            available = [l for l in letter_pool 
-                        if l not in self.derived_state.letters_completed]
-            
-            # Prioritize letters that need practice
-            if self.derived_state.letters_struggled:
-                for letter in self.derived_state.letters_struggled:
-                    if letter in available:
-                        return letter
-                        
-            # Return next available letter
-            if available:
-                return available[0]
-            else:
-                # All letters in difficulty completed, move to next level
-                if self.derived_state.difficulty_level == DifficultyLevel.EASY:
-                    return progression['medium_letters'][0]
-                elif self.derived_state.difficulty_level == DifficultyLevel.MEDIUM:
-                    return progression['hard_letters'][0]
-                else:
-                    return "A"  # Start over
-                    
-        except Exception as e:
-            print(f"Error suggesting next letter: {e}")
-            return "A"
+        state = self.derived_state
+        return _suggest_letter(
+            state.difficulty_level,
+            frozenset(state.letters_completed),
+            tuple(state.letters_struggled)  # Order sets practice priority
+        )
             
     def reset(self):
         """Reset session memory (for new session)"""
-        self.conversation_buffer.clear()
+        self._user_turns.clear()
+        self._assistant_turns.clear()
+        self._conversation_text = None
+        self.mark_state_changed()
         self.derived_state = DerivedState()
         self.session_start = datetime.now()
+        self._session_start_mono = time.monotonic()
         self.total_interactions = 0
         self.current_activity = None
         
@@ -283,4 +331,5 @@ class SessionMemory:
         if tts is not None:
             self.tts_enabled = tts
         if asr is not None:
-            self.asr_enabled = asr
\ No newline at end of file
+            self.asr_enabled = asr
+        self.mark_state_changed()
\ No newline at end of file
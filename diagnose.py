@@ -8,7 +8,8 @@ Author: Nouran Darwish
 import sys
 import os
 import platform
-import subprocess
+import shutil
+from importlib.util import find_spec
 from pathlib import Path
 
 # Colors for terminal output
@@ -107,8 +108,12 @@ def check_required_packages():
     
     return all_installed
 
-def check_optional_packages():
-    """Check optional AI packages"""
+def check_optional_packages(deep=False):
+    """
+    Check optional AI packages
+    Only looks the packages up (torch alone takes seconds to import);
+    with deep=True, installed packages are also imported
+    """
     print(f"\n{Colors.BLUE}3. Optional AI Packages{Colors.END}")
     print("-" * 40)
     
@@ -121,14 +126,17 @@ def check_optional_packages():
     }
     
     for package, description in packages.items():
-        try:
-            if package == "cv2":
-                import cv2
-            else:
-                __import__(package)
-            print_check(package, True, description)
-        except ImportError:
+        if find_spec(package) is None:
             print_check(package, False, f"Not installed - {description}")
+            continue
+        
+        if deep:
+            try:
+                __import__(package)
+            except ImportError as e:
+                print_check(package, False, f"Installed but failed to import ({e}) - {description}")
+                continue
+        print_check(package, True, description)
 
 def check_system_dependencies():
     """Check system-level dependencies"""
@@ -141,24 +149,9 @@ def check_system_dependencies():
     }
     
     for cmd, description in dependencies.items():
-        try:
-            if platform.system() == "Windows":
-                result = subprocess.run(
-                    ["where", cmd],
-                    capture_output=True,
-                    text=True
-                )
-            else:
-                result = subprocess.run(
-                    ["which", cmd],
-                    capture_output=True,
-                    text=True
-                )
-            
-            found = result.returncode == 0
-            print_check(cmd, found, description if found else f"Not found - {description}")
-        except Exception:
-            print_check(cmd, False, f"Could not check - {description}")
+        # PATH lookup in-process (handles .exe on Windows) instead of `which`/`where`
+        found = shutil.which(cmd) is not None
+        print_check(cmd, found, description if found else f"Not found - {description}")
 
 def check_project_files():
     """Check if all required project files exist"""
@@ -301,7 +294,7 @@ def main():
     # Run all checks
     python_ok = check_python()
     packages_ok = check_required_packages()
-    check_optional_packages()
+    check_optional_packages(deep="--deep" in sys.argv)
     check_system_dependencies()
     files_ok = check_project_files()
     network_ok = check_network()
@@ -87,11 +87,11 @@ class OllamaClient:
                 result = response.json()
                 return result.get("response", "").strip()
             else:
-                logger.error(f"Ollama error: {response.status_code}")
+                logger.error("Ollama error: %s", response.status_code)
                 return self._fallback_response(prompt)
                 
         except Exception as e:
-            logger.error(f"Ollama generation error: {e}")
+            logger.error("Ollama generation error: %s", e)
             return self._fallback_response(prompt)
             
     def chat(self, messages: List[Dict[str, str]], temperature: float = 0.7) -> str:
@@ -129,7 +129,7 @@ class OllamaClient:
                 return self._fallback_response(messages[-1]['content'] if messages else "")
                 
         except Exception as e:
-            logger.error(f"Ollama chat error: {e}")
+            logger.error("Ollama chat error: %s", e)
             return self._fallback_response(messages[-1]['content'] if messages else "")
             
     def _fallback_response(self, prompt: str) -> str:
@@ -11,7 +11,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import and run the full AI app
-from app.full_ai_app import create_full_interface, tutor
+from app.full_ai_app import launch_app
 
 if __name__ == "__main__":
     print("\n" + "="*70)
@@ -25,22 +25,11 @@ if __name__ == "__main__":
     print("  ✅ Real-time Pronunciation Feedback")
     print("  ✅ Complete Assessment Tracking")
     print("="*70)
-    print("\nInitializing...")
+    print("\nOpen your browser to: http://localhost:7860")
+    print("="*70 + "\n")
     
     try:
-        app = create_full_interface()
-        print("\n✅ System Ready!")
-        print("Open your browser to: http://localhost:7860")
-        print("="*70 + "\n")
-        
-        app.queue(max_size=20).launch(
-            server_name="0.0.0.0",
-            server_port=7860,
-            share=True,
-            debug=False,
-            show_api=False,
-            show_error=True
-        )
+        launch_app()
     except KeyboardInterrupt:
         print("\n\nShutting down gracefully...")
         print("Thank you for using KidSafe Alphabet Tutor! 🫧")
@@ -380,8 +380,8 @@ for module, name in modules_to_test:
     def check_python_version(self):
         """Check if Python version is compatible"""
         version_info = sys.version_info
-        if version_info.major < 3 or (version_info.major == 3 and version_info.minor < 8):
-            print(f"❌ Python 3.8+ required (found {version_info.major}.{version_info.minor})")
+        if version_info.major < 3 or (version_info.major == 3 and version_info.minor < 10):
+            print(f"❌ Python 3.10+ required (found {version_info.major}.{version_info.minor})")
             sys.exit(1)
         
         print(f"✅ Python {version_info.major}.{version_info.minor}.{version_info.micro} detected")
@@ -5,9 +5,10 @@ Author: Nouran Darwish
 """
 
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, decode_audio
 import torch
 import logging
+from math import gcd
 from typing import Tuple, Optional
 import time
 
@@ -47,6 +48,7 @@ class ASRProcessor:
         )
         
         self.sample_rate = 16000
+        
         logger.info("ASR initialized successfully")
         
     def transcribe(self, audio_input: np.ndarray, language: str = "en") -> Tuple[str, float]:
@@ -103,43 +105,70 @@ class ASRProcessor:
             avg_confidence = np.mean(confidence_scores) if confidence_scores else 0.5
             
             elapsed = time.time() - start_time
-            logger.info(f"Transcription completed in {elapsed:.3f}s: '{transcription}' (conf: {avg_confidence:.2f})")
+            logger.info("Transcription completed in %.3fs: %r (conf: %.2f)", elapsed, transcription, avg_confidence)
             
             return transcription, float(avg_confidence)
             
         except Exception as e:
-            logger.error(f"Transcription error: {e}")
+            logger.error("Transcription error: %s", e)
+            return "", 0.0
+    
+    def warmup(self):
+        """
+        Run the VAD and one dummy decode so the first real request
+        doesn't pay the one-time model initialization costs
+        """
+        try:
+            audio = np.zeros(self.sample_rate, dtype=np.float32)
+            self._has_voice_activity(audio)
+            segments, _ = self.model.transcribe(audio, language="en", beam_size=1, without_timestamps=True)
+            list(segments)  # Segments are generated lazily
+        except Exception as e:
+            logger.warning("ASR warm-up failed: %s", e)
+    
+    def transcribe_file(self, audio_path: str, language: str = "en") -> Tuple[str, float]:
+        """
+        Transcribe an audio file (e.g. a Gradio recording) to text
+        Decodes straight to 16kHz mono float32, so no resampling is needed
+        """
+        try:
+            audio = decode_audio(audio_path, sampling_rate=self.sample_rate)
+        except Exception as e:
+            logger.error("Audio decode error: %s", e)
             return "", 0.0
+        return self.transcribe(audio, language)
     
     def _preprocess_audio(self, audio_input: np.ndarray) -> np.ndarray:
         """
         Preprocess audio for transcription
+        Every step is a whole-array NumPy/SciPy op (no per-sample Python)
         """
         # Handle different input formats
+        sample_rate = self.sample_rate
         if isinstance(audio_input, tuple):
             sample_rate, audio = audio_input
-            # Resample to 16kHz if needed
-            if sample_rate != self.sample_rate:
-                import librosa
-                audio = librosa.resample(
-                    audio.astype(np.float32),
-                    orig_sr=sample_rate,
-                    target_sr=self.sample_rate
-                )
         else:
             audio = audio_input
             
+        audio = np.ascontiguousarray(audio)
+        is_pcm = np.issubdtype(audio.dtype, np.integer)
+            
+        # Convert stereo to mono first so only one channel gets resampled
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+            
         # Convert to float32 if needed
-        if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
+        audio = audio.astype(np.float32, copy=False)
             
-        # Normalize audio
-        if audio.max() > 1.0:
-            audio = audio / 32768.0
+        # Normalize audio (integer PCM, or float data still in PCM range)
+        if is_pcm or np.abs(audio).max(initial=0.0) > 1.0:
+            audio = audio * np.float32(1 / 32768.0)
             
-        # Convert stereo to mono if needed
-        if len(audio.shape) > 1:
-            audio = np.mean(audio, axis=1)
+        # Resample to 16kHz if needed
+        if sample_rate != self.sample_rate:
+            from scipy.signal import resample_poly
+            g = gcd(int(sample_rate), self.sample_rate)
+            audio = resample_poly(audio, self.sample_rate // g, int(sample_rate) // g).astype(np.float32)
             
         return audio
     
@@ -161,7 +190,7 @@ class ASRProcessor:
             return confidence > threshold
             
         except Exception as e:
-            logger.warning(f"VAD check failed: {e}")
+            logger.warning("VAD check failed: %s", e)
             # Fallback to energy-based detection
             return np.max(np.abs(audio)) > 0.01
     
@@ -6,7 +6,8 @@ Author: Nouran Darwish
 
 import numpy as np
 import logging
-from typing import Optional, Generator
+import re
+from typing import Optional, Generator, List
 import subprocess
 import wave
 import io
@@ -17,6 +18,9 @@ import json
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sentence boundaries for incremental synthesis
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
 class TTSProcessor:
     """
     TTS processor using Piper TTS for child-friendly voice synthesis
@@ -76,7 +80,7 @@ class TTSProcessor:
                 audio = self._synthesize_fallback(text)
                 
             elapsed = time.time() - start_time
-            logger.info(f"TTS synthesis completed in {elapsed:.3f}s")
+            logger.info("TTS synthesis completed in %.3fs", elapsed)
             
             return audio
             
@@ -168,8 +172,10 @@ class TTSProcessor:
         Yields audio chunks as they're generated
         """
         if not self.piper_available:
-            # Fallback: return entire audio at once
-            yield self._synthesize_fallback(text)
+            # Fallback: synthesize sentence by sentence so playback can start
+            # after the first sentence instead of the whole response
+            for sentence in self._split_sentences(text):
+                yield self._synthesize_fallback(sentence)
             return
             
         # Prepare Piper command for streaming
@@ -192,18 +198,33 @@ class TTSProcessor:
         process.stdin.write(text.encode())
         process.stdin.close()
         
-        # Stream output chunks
+        # Stream output chunks, reading into one reused byte buffer; each
+        # yielded chunk is a new array the caller owns
+        raw = bytearray(chunk_size * 2)  # 2 bytes per sample
+        raw_view = memoryview(raw)
+        pcm = np.frombuffer(raw, dtype=np.int16)
+        scale = np.float32(1.0 / 32768.0)
+        
         while True:
-            chunk = process.stdout.read(chunk_size * 2)  # 2 bytes per sample
-            if not chunk:
+            n = process.stdout.readinto(raw)
+            if not n:
                 break
-                
-            audio_chunk = np.frombuffer(chunk, dtype=np.int16)
-            audio_chunk = audio_chunk.astype(np.float32) / 32768.0
-            yield audio_chunk
+            # The pipe is unbuffered, so top up to a whole number of samples
+            while n % 2:
+                extra = process.stdout.readinto(raw_view[n:n + 1])
+                if not extra:
+                    break
+                n += extra
+            samples = n // 2
+            
+            yield np.multiply(pcm[:samples], scale, dtype=np.float32)
             
         process.wait()
         
+    def _split_sentences(self, text: str) -> List[str]:
+        """Split text on sentence-ending punctuation"""
+        return [s for s in _SENTENCE_END_RE.split(text.strip()) if s]
+    
     def set_speech_rate(self, rate: float):
         """
         Set speech rate (0.5 = half speed, 1.0 = normal, 2.0 = double)
@@ -93,10 +93,10 @@ def test_environment():
     
     # Check Python version
     print(f"Python Version: {sys.version}")
-    if sys.version_info >= (3, 8):
-        print("✅ Python 3.8+ detected")
+    if sys.version_info >= (3, 10):
+        print("✅ Python 3.10+ detected")
     else:
-        print("❌ Python 3.8+ required")
+        print("❌ Python 3.10+ required")
     
     # Check .env file
     if os.path.exists(".env"):
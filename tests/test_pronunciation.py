@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Pronunciation scoring tests for the full AI tutor
+Author: Nouran Darwish
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+# The full app module needs the UI/audio stack at import time
+pytest.importorskip("gradio")
+pytest.importorskip("numpy")
+pytest.importorskip("dotenv")
+
+from app.full_ai_app import FullAIAlphabetTutor
+from app.curriculum import load_curriculum
+from app.state import SessionMemory
+
+
+@pytest.fixture
+def tutor():
+    """Tutor with only the pieces pronunciation scoring uses (no models loaded)"""
+    tutor = FullAIAlphabetTutor.__new__(FullAIAlphabetTutor)
+    tutor.session_memory = SessionMemory()
+    tutor._letter_phrases = tutor._build_letter_phrases(load_curriculum())
+    return tutor
+
+
+def score_for(tutor, letter, transcript):
+    tutor.session_memory.derived_state.current_letter = letter
+    return tutor._analyze_pronunciation(transcript)
+
+
+def test_example_word_with_trailing_punctuation(tutor):
+    assert score_for(tutor, "A", "Apple.") == pytest.approx(0.7)
+
+
+def test_letter_with_trailing_punctuation(tutor):
+    assert score_for(tutor, "A", "A!") == pytest.approx(0.8)
+
+
+def test_letter_and_word(tutor):
+    assert score_for(tutor, "A", "A, for apple!") == pytest.approx(1.0)
+
+
+def test_multi_word_example(tutor):
+    assert score_for(tutor, "I", "I like ice cream!") == pytest.approx(1.0)
+
+
+def test_word_prefix_does_not_count(tutor):
+    # "ants" is not "ant", and the "a" inside words is not the letter
+    assert score_for(tutor, "A", "Bananas and ants") == pytest.approx(0.5)
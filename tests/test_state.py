@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Session memory tests: letter suggestions, name/letter extraction and caching
+Author: Nouran Darwish
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from app.state import SessionMemory, DifficultyLevel
+from agents.crew_setup_simple import AlphabetTutorAgents
+
+
+@pytest.fixture
+def memory():
+    return SessionMemory()
+
+
+def complete(memory, letters):
+    for letter in letters:
+        memory.derived_state.letters_completed.setdefault(letter)
+
+
+@pytest.mark.parametrize("level, letters, expected", [
+    (DifficultyLevel.EASY, "AEIOU", "B"),
+    (DifficultyLevel.MEDIUM, "BCDFGHLMNPRST", "J"),
+    (DifficultyLevel.HARD, "JKQVWXYZ", "A"),
+])
+def test_suggestion_moves_on_when_level_completed(memory, level, letters, expected):
+    memory.derived_state.difficulty_level = level
+    complete(memory, letters)
+    assert memory.suggest_next_letter() == expected
+
+
+def test_suggestion_prefers_struggled_letters(memory):
+    complete(memory, "A")
+    memory.derived_state.letters_struggled.setdefault("O")
+    assert memory.suggest_next_letter() == "O"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Teach me “B” please", "B"),
+    ("Can we do ‘c’?", "C"),
+    ("Time to learn letters", None),
+])
+def test_letter_extraction(memory, text, expected):
+    assert memory._extract_current_letter(text, "") == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("My name is sam.", "Sam"),
+    ("call me Bo!", "Bo"),
+    ("I am happy, my name is Sam", "Sam"),
+    ("Hi, I am 5 and my name is Sam", "Sam"),
+    ("I'm Lea", "Lea"),
+    ("Hello there", None),
+])
+def test_name_extraction_keeps_marker_priority(memory, text, expected):
+    assert memory._extract_name(text) == expected
+
+
+def test_state_dict_is_a_fresh_copy(memory):
+    complete(memory, "A")
+    state = memory.get_derived_state_dict()
+    state["letters_completed"].append("Z")
+    state["letters_struggled"].append("Q")
+
+    fresh = memory.get_derived_state_dict()
+    assert fresh["letters_completed"] == ["A"]
+    assert fresh["letters_struggled"] == []
+
+
+def test_formatted_memory_refreshes_after_direct_change(memory):
+    before = memory.get_formatted_memory()
+    assert memory.get_formatted_memory() is before  # Cached
+
+    memory.derived_state.child_name = "Zoe"
+    memory.mark_state_changed()
+    assert "Name: Zoe" in memory.get_formatted_memory()
+
+
+def test_formatted_memory_refreshes_after_turn(memory):
+    memory.get_formatted_memory()
+    memory.add_turn("My name is Ava, teach me D", "Let's learn D!")
+
+    text = memory.get_formatted_memory()
+    assert "Name: Ava" in text
+    assert "Current Letter: D" in text
+    assert "Child: My name is Ava, teach me D" in text
+
+
+def test_formatted_memory_refreshes_after_agent_feedback(memory):
+    agents = AlphabetTutorAgents(memory)
+    memory.get_formatted_memory()
+    agents.feedback_agent_process({"confidence": 0.9, "current_letter": "A"})
+
+    assert "Streak: 1 correct" in memory.get_formatted_memory()
+    assert memory.get_derived_state_dict()["streak_count"] == 1
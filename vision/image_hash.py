@@ -0,0 +1,20 @@
+"""
+Perceptual Image Hashing
+Cheap 64-bit average hash used to key detection caches
+Author: Nouran Darwish
+"""
+
+import cv2
+import numpy as np
+
+
+def average_hash(image: np.ndarray) -> int:
+    """
+    Compute an 8x8 mean-threshold hash (aHash) of an image
+    Near-identical frames (same card held steady) hash to the same value
+    """
+    small = cv2.resize(image, (8, 8), interpolation=cv2.INTER_AREA)
+    if small.ndim == 3:
+        small = cv2.cvtColor(small, cv2.COLOR_RGB2GRAY)
+    bits = small > small.mean()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
@@ -8,8 +8,11 @@ import cv2
 import pytesseract
 import numpy as np
 from typing import Dict, Optional, List, Tuple
+from collections import OrderedDict
 import logging
 
+from .image_hash import average_hash
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,13 @@ class LetterDetector:
         # Tesseract configuration for single character detection
         self.tesseract_config = '--psm 10 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ'
         
+        # Frames wider than this are downscaled before OCR
+        self.max_width = 640
+        
+        # Detection results keyed by perceptual hash of the frame
+        self.cache_size = 32
+        self._cache: "OrderedDict[int, Dict]" = OrderedDict()
+        
         # Check Tesseract availability
         try:
             pytesseract.get_tesseract_version()
@@ -48,6 +58,36 @@ class LetterDetector:
             if not self.tesseract_available:
                 return {"detected": False, "error": "Tesseract not available"}
                 
+            # Reuse the result for a frame we've already seen
+            key = average_hash(image)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return dict(cached)
+                
+            result = self._detect_uncached(image)
+            if "error" not in result:
+                self._cache[key] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return dict(result)
+                
+        except Exception as e:
+            logger.error("Letter detection error: %s", e)
+            return {"detected": False, "error": str(e)}
+            
+    def _detect_uncached(self, image: np.ndarray) -> Dict:
+        """
+        Run preprocessing, region search and OCR on an image
+        """
+        try:
+            # Work on a bounded frame size; bboxes are mapped back below
+            scale = 1.0
+            if image.shape[1] > self.max_width:
+                scale = image.shape[1] / self.max_width
+                new_size = (self.max_width, int(image.shape[0] / scale))
+                image = cv2.resize(image, new_size, interpolation=cv2.INTER_AREA)
+                
             # Preprocess image
             processed = self._preprocess_image(image)
             
@@ -74,7 +114,7 @@ class LetterDetector:
                     detections.append({
                         "letter": text.strip()[0],  # Take first character
                         "confidence": confidence,
-                        "bbox": region
+                        "bbox": tuple(int(v * scale) for v in region)
                     })
                     
             if detections:
@@ -94,7 +134,7 @@ class LetterDetector:
                 }
                 
         except Exception as e:
-            logger.error(f"Letter detection error: {e}")
+            logger.error("Letter detection error: %s", e)
             return {"detected": False, "error": str(e)}
             
     def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
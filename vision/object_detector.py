@@ -4,12 +4,16 @@ Uses YOLOv8n for detecting objects mapped to letters
 Author: Nouran Darwish
 """
 
+import os
 import cv2
 import numpy as np
 from typing import Dict, List, Optional
+from collections import OrderedDict
 import logging
 import json
 
+from .image_hash import average_hash
+
 try:
     from ultralytics import YOLO
     YOLO_AVAILABLE = True
@@ -19,6 +23,50 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# YOLO weights, and their INT8-quantized ONNX export (preferred when present)
+YOLO_WEIGHTS = 'yolov8n.pt'
+YOLO_INT8_WEIGHTS = 'yolov8n.int8.onnx'
+
+# Common COCO classes to letter mapping
+COCO_LETTER_MAP = {
+    'person': 'P',
+    'bicycle': 'B',
+    'car': 'C',
+    'airplane': 'A',
+    'bird': 'B',
+    'boat': 'B',
+    'bottle': 'B',
+    'chair': 'C',
+    'cow': 'C',
+    'dining table': 'T',
+    'horse': 'H',
+    'sheep': 'S',
+    'train': 'T',
+    'tv': 'T',
+    'laptop': 'L',
+    'keyboard': 'K',
+    'book': 'B',
+    'clock': 'C',
+    'scissors': 'S',
+    'teddy bear': 'T',
+    'hair drier': 'H',
+    'toothbrush': 'T'
+}
+
+def export_int8_model(weights: str = YOLO_WEIGHTS, output: str = YOLO_INT8_WEIGHTS,
+                      imgsz: int = 320) -> str:
+    """
+    Export YOLO to ONNX and quantize its weights to INT8 (run once, offline)
+    The export has a fixed input size, so keep imgsz equal to ObjectDetector.input_size
+    """
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    
+    onnx_path = YOLO(weights).export(format='onnx', imgsz=imgsz)
+    # ConvInteger on the CPU provider needs unsigned weights
+    quantize_dynamic(onnx_path, output, weight_type=QuantType.QUInt8)
+    logger.info("Quantized detector written to %s", output)
+    return output
+
 class ObjectDetector:
     """
     Detects objects that map to alphabet letters
@@ -59,12 +107,26 @@ class ObjectDetector:
             'zebra': 'Z'
         }
         
+        # Resolved label -> letter lookups (model labels are a small fixed set)
+        self._label_letters: Dict[str, Optional[str]] = {}
+        
+        # Fixed YOLO inference size; every frame is letterboxed to this shape
+        self.input_size = 320
+        
+        # Detection results keyed by (perceptual hash, threshold)
+        self.cache_size = 32
+        self._cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+        
         # Initialize YOLO if available
         if YOLO_AVAILABLE:
             try:
-                self.model = YOLO('yolov8n.pt')
+                if os.path.exists(YOLO_INT8_WEIGHTS):
+                    self.model = YOLO(YOLO_INT8_WEIGHTS, task='detect')
+                    logger.info("YOLOv8n (INT8 ONNX) loaded successfully")
+                else:
+                    self.model = YOLO(YOLO_WEIGHTS)
+                    logger.info("YOLOv8n loaded successfully")
                 self.yolo_available = True
-                logger.info("YOLOv8n loaded successfully")
             except Exception as e:
                 logger.warning(f"Failed to load YOLO: {e}")
                 self.yolo_available = False
@@ -84,21 +146,33 @@ class ObjectDetector:
             Dictionary with detection results
         """
         try:
+            # Reuse the result for a frame we've already seen
+            key = (average_hash(image), confidence_threshold)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return dict(cached)
+                
             if self.yolo_available:
-                return self._detect_yolo(image, confidence_threshold)
+                result = self._detect_yolo(image, confidence_threshold)
             else:
-                return self._detect_fallback(image)
+                result = self._detect_fallback(image)
+                
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return dict(result)
                 
         except Exception as e:
-            logger.error(f"Object detection error: {e}")
+            logger.error("Object detection error: %s", e)
             return {"detected": False, "error": str(e)}
             
     def _detect_yolo(self, image: np.ndarray, confidence_threshold: float) -> Dict:
         """
         Detect objects using YOLOv8
         """
-        # Run inference
-        results = self.model(image, conf=confidence_threshold)
+        # Run inference at a fixed input size (boxes come back in frame coordinates)
+        results = self.model(image, conf=confidence_threshold, imgsz=self.input_size, verbose=False)
         
         detections = []
         
@@ -193,6 +267,17 @@ class ObjectDetector:
         """
         object_lower = object_name.lower()
         
+        try:
+            return self._label_letters[object_lower]
+        except KeyError:
+            letter = self._resolve_letter(object_lower)
+            self._label_letters[object_lower] = letter
+            return letter
+        
+    def _resolve_letter(self, object_lower: str) -> Optional[str]:
+        """
+        Match a lowercase label against the letter maps (uncached)
+        """
         # Direct match
         if object_lower in self.object_letter_map:
             return self.object_letter_map[object_lower]
@@ -202,36 +287,7 @@ class ObjectDetector:
             if key in object_lower or object_lower in key:
                 return letter
                 
-        # Common COCO classes to letter mapping
-        coco_map = {
-            'person': 'P',
-            'bicycle': 'B',
-            'car': 'C',
-            'airplane': 'A',
-            'bird': 'B',
-            'boat': 'B',
-            'bottle': 'B',
-            'chair': 'C',
-            'cow': 'C',
-            'dining table': 'T',
-            'horse': 'H',
-            'sheep': 'S',
-            'train': 'T',
-            'tv': 'T',
-            'laptop': 'L',
-            'keyboard': 'K',
-            'book': 'B',
-            'clock': 'C',
-            'scissors': 'S',
-            'teddy bear': 'T',
-            'hair drier': 'H',
-            'toothbrush': 'T'
-        }
-        
-        if object_lower in coco_map:
-            return coco_map[object_lower]
-            
-        return None
+        return COCO_LETTER_MAP.get(object_lower)
         
     def _detect_circles(self, image: np.ndarray) -> List:
         """